@@ -91,6 +91,12 @@ from liveness import is_var
 from errors import CodegenError, AssignmentError
 
 
+# IR operator -> target opcode, and the operators whose operands may be swapped.
+# Built once at import time rather than on every op_to_asm call.
+_OPCODE_MAP = {"+": "ADD", "-": "SUB", "*": "MUL", "/": "DIV"}
+_COMMUTATIVE_OPS = frozenset("+*")
+
+
 def _reg(var: str, assignments: Dict[str, int]) -> str:
     """
     Return the register name assigned to an IR variable.
@@ -225,8 +231,7 @@ def op_to_asm(op: Operation, assignments: Dict[str, int]) -> List[AsmInstruction
         return instrs
 
     # dst = src1 op src2
-    opcode_map = {"+": "ADD", "-": "SUB", "*": "MUL", "/": "DIV"}
-    if op.operator not in opcode_map:
+    if op.operator not in _OPCODE_MAP:
         raise CodegenError(f"Unsupported operator: {op.operator!r}")
     
     if op.operand2 is None:
@@ -234,7 +239,7 @@ def op_to_asm(op: Operation, assignments: Dict[str, int]) -> List[AsmInstruction
 
     src1 = _asm_operand(op.operand1, assignments)
     src2 = _asm_operand(op.operand2, assignments)
-    asm_op = opcode_map[op.operator]
+    asm_op = _OPCODE_MAP[op.operator]
 
     # Case 1: src1 already in dst register — skip the MOV
     if src1 == dst_r:
@@ -243,7 +248,7 @@ def op_to_asm(op: Operation, assignments: Dict[str, int]) -> List[AsmInstruction
     # Case 2: src2 is in dst register — MOV would clobber it
     if src2 == dst_r:
         # Commutative ops: just swap operands
-        if op.operator in {"+", "*"}:
+        if op.operator in _COMMUTATIVE_OPS:
             return [AsmInstruction(asm_op, src1, dst_r)]
         # SUB: negate then add (dst has src2, we want src1 - src2)
         if op.operator == "-":
@@ -304,8 +309,7 @@ def generate_target(code: IntermediateCode, assignments: Dict[str, int]) -> Targ
     dirty: Set[str] = set()  # vars written in block
     for op in code.oplist:
         dirty.add(op.destination)
-        for instr in op_to_asm(op, assignments):
-            target.add(instr)
+        target.extend(op_to_asm(op, assignments))
 
     # --- 3) live-on-exit stores ---
     live_out = set(code.live_out)
@@ -1,3 +1,4 @@
+import heapq
 from typing import Set, Dict, List
 from liveness import is_var
 
@@ -83,11 +84,25 @@ class InterferenceGraph:
             A dictionary mapping variable -> assigned register/color.
             Example: {"a": 0, "b": 1}
             Meaning: a gets register 0, b gets register 1.
+
+        self.color_mask:
+            A dictionary mapping variable -> bitmask of the colors its
+            neighbors currently hold (bit c set => some neighbor has color c).
+            Kept up to date by assign/unassign so is_safe is one bit test.
         """
         # Use an adjacency set representation for the undirected graph
         self.nodes: Dict[str, Set[str]] = {var: set() for var in variables}
         # Track assigned registers: { "var_name": register_index }
         self.assignments: Dict[str, int] = {}
+        # Colors held by each variable's neighbors, as a bitmask
+        self.color_mask: Dict[str, int] = {var: 0 for var in variables}
+        # How many neighbors of a variable hold a color: { (var, color): count }
+        # Needed so unassign only clears a mask bit once no neighbor has it
+        self._color_refs: Dict[tuple, int] = {}
+        # Min-heap of (insertion index, var) for variables that may still be
+        # unassigned. Entries for since-assigned variables are skipped lazily.
+        self._order: Dict[str, int] = {var: i for i, var in enumerate(self.nodes)}
+        self._unassigned: List[tuple] = list(enumerate(self.nodes))
 
     def add_edge(self, u: str, v: str):
         """
@@ -108,6 +123,26 @@ class InterferenceGraph:
             self.nodes[u].add(v)
             self.nodes[v].add(u)
     
+    def add_clique(self, live_set: Set[str]):
+        """
+        Make every variable in live_set interfere with every other one.
+
+        Meaning:
+        - All variables live at the same program point interfere pairwise.
+
+        Why not call add_edge for each pair:
+        - Pairwise add_edge is k^2 Python-level calls for k live variables.
+        - Unioning the whole set into each neighbor set is k set operations,
+          each done in C. Self-edges are removed afterwards with discard.
+
+        Important:
+        - Like add_edge, this assumes every variable is already a node.
+        """
+        for var in live_set:
+            neighbors = self.nodes[var]
+            neighbors |= live_set
+            neighbors.discard(var)
+
     def assign(self, var: str, color: int):
         """
         Assign a 'color' (register number) to a variable.
@@ -124,9 +159,20 @@ class InterferenceGraph:
 
         This doesn't check safety by itself.
         - Typically, you call is_safe(var, color) first.
+
+        Every neighbor's color_mask gains this color's bit. Edges should all
+        be added before coloring starts, or the masks will be out of date.
         """
+        if var in self.assignments:
+            self.unassign(var)
         self.assignments[var] = color
 
+        bit = 1 << color
+        for neighbor in self.nodes[var]:
+            key = (neighbor, color)
+            self._color_refs[key] = self._color_refs.get(key, 0) + 1
+            self.color_mask[neighbor] |= bit
+
     def unassign(self, var: str):
         """
         Remove the current color assignment for a variable.
@@ -141,8 +187,20 @@ class InterferenceGraph:
         - later we realize it causes a conflict
         - unassign("a") to remove that choice
         """
-        if var in self.assignments:
-            del self.assignments[var]
+        color = self.assignments.pop(var, None)
+        if color is None:
+            return
+        heapq.heappush(self._unassigned, (self._order[var], var))
+
+        bit = 1 << color
+        for neighbor in self.nodes[var]:
+            key = (neighbor, color)
+            count = self._color_refs[key] - 1
+            if count:
+                self._color_refs[key] = count
+            else:
+                del self._color_refs[key]
+                self.color_mask[neighbor] &= ~bit
     
     def get_unassigned_variable(self) -> str:
         """
@@ -158,10 +216,16 @@ class InterferenceGraph:
         - "First" here depends on dictionary iteration order.
           Since Python preserves insertion order, it will follow the order
           variables were inserted into self.nodes.
+        - Rather than rescanning every node, a heap ordered by insertion index
+          is kept. Assigned variables are popped off its top as we meet
+          them, so each call is amortized O(log V) instead of O(V).
         """
-        for var in self.nodes:
+        heap = self._unassigned
+        while heap:
+            var = heap[0][1]
             if var not in self.assignments:
                 return var
+            heapq.heappop(heap)
         return None
 
     def is_safe(self, var: str, color: int) -> bool:
@@ -188,10 +252,7 @@ class InterferenceGraph:
         - If neighbors(var) = {"b", "c"} and assignments = {"b": 1}
           then is_safe(var, 1) returns False (because b already has 1).
         """
-        for neighbor in self.get_neighbors(var):
-            if self.assignments.get(neighbor) == color:
-                return False
-        return True
+        return not (self.color_mask.get(var, 0) >> color) & 1
 
     def get_neighbors(self, var: str) -> Set[str]:
         """
@@ -228,11 +289,12 @@ class InterferenceGraph:
         Notes:
         - We sort variables and neighbors so the output is stable and readable.
         - This helps debugging, because you get the same ordering each run.
+        - The whole table is built first and printed with a single call.
         """
-        print("--- Variable Interference Table ---")
-        for var in sorted(self.nodes.keys()):
-            neighbors = sorted(list(self.nodes[var]))
-            print(f"{var}: {', '.join(neighbors)}")
+        lines = ["--- Variable Interference Table ---"]
+        for var in sorted(self.nodes):
+            lines.append(f"{var}: {', '.join(sorted(self.nodes[var]))}")
+        print("\n".join(lines))
             
 def build_interference_graph(code) -> InterferenceGraph:
     """
@@ -272,40 +334,121 @@ def build_interference_graph(code) -> InterferenceGraph:
         if op.operand1: all_vars.add(op.operand1)
         if op.operand2: all_vars.add(op.operand2)
     
-    # Filter to ensure only valid variables are nodes (no constants)
-    # Using a list comprehension to maintain consistent ordering
-    valid_vars = sorted([v for v in all_vars if is_var(v)])
+    # Filter to ensure only valid variables are nodes (no constants).
+    # Sorting keeps the node order, and so the colouring, independent of
+    # the order variables happen to appear in
+    valid_vars = sorted(filter(is_var, all_vars))
     
     graph = InterferenceGraph(valid_vars)
 
-    # A variable interferes with everything else live at the same point.
     # A variable interferes with everything else live at the same point.
     # Include live_before[0] so that variables live on entry also interfere.
+    # Straight-line code repeats the same live set at many points; a clique
+    # only needs adding once, so duplicates are dropped first.
     all_live_sets = [code.live_before[0]] + code.live_after if code.oplist else []
-    for live_set in all_live_sets:
-        live_list = list(live_set)
-        for i in range(len(live_list)):
-            for j in range(i + 1, len(live_list)):
-                graph.add_edge(live_list[i], live_list[j])
+    for live_set in dict.fromkeys(map(frozenset, all_live_sets)):
+        graph.add_clique(live_set)
                 
     return graph
 
+def simplify_colour(graph, num_regs) -> bool:
+    """
+    Colour the graph with Chaitin/Kempe-style simplification.
+
+    Simplify:
+    - Any variable with fewer than num_regs neighbours can always be coloured
+      later, whatever its neighbours get. Remove it (push it on a stack) and
+      lower its neighbours' degrees, which may make them removable in turn.
+
+    Select:
+    - Once every variable has been removed, pop the stack and give each
+      variable the lowest register none of its neighbours has.
+
+    Returns
+    -------
+    bool
+        True  -> every variable was coloured; graph.assignments is complete.
+        False -> simplification stalled (every remaining variable has at least
+                 num_regs neighbours). Nothing is assigned in that case.
+
+    Among the removable variables we always take the one latest in node
+    order, so Select colours roughly in node order and the result is
+    deterministic. It often matches the backtracking search (as on
+    test.txt), but the register chosen for a variable can differ from what
+    the backtracker would pick. Any colouring returned is still valid:
+    no two interfering variables share a register.
+
+    This runs in O((V + E) log V) and never backtracks.
+    """
+    # Bind attributes and functions used in the loops to locals once
+    nodes = graph.nodes
+    heappop, heappush = heapq.heappop, heapq.heappush
+
+    order = {var: i for i, var in enumerate(nodes)}
+    degree = {var: len(neighbors) for var, neighbors in nodes.items()}
+    worklist = [(-order[var], var) for var in nodes if degree[var] < num_regs]
+    heapq.heapify(worklist)
+    removed: Set[str] = set()
+    stack: List[str] = []
+
+    while worklist:
+        _, var = heappop(worklist)
+        stack.append(var)
+        removed.add(var)
+        for neighbor in nodes[var]:
+            if neighbor not in removed:
+                degree[neighbor] -= 1
+                if degree[neighbor] == num_regs - 1:    # just became removable
+                    heappush(worklist, (-order[neighbor], neighbor))
+
+    if len(stack) < len(nodes):
+        return False
+
+    color_mask, assign = graph.color_mask, graph.assign
+    while stack:
+        var = stack.pop()
+        taken = color_mask[var]
+        assign(var, (~taken & (taken + 1)).bit_length() - 1)   # lowest clear bit
+    return True
+
 def allocate_registers(graph, num_regs):
+    """
+    Assign a register to every variable in the graph.
+
+    The fast simplify_colour pass is tried first. If it stalls, the graph may
+    still be colourable, so we fall back to the exhaustive backtracking search.
+
+    Returns True if every variable was assigned, False if the graph is not
+    num_regs-colourable.
+    """
+    if simplify_colour(graph, num_regs):
+        return True
+    return _backtrack(graph, num_regs)
+
+def _backtrack(graph, num_regs):
     """
     A recursive function to solve the register allocation puzzle.
     Closely follows the Eight Queens 'placeQueensSafely' logic.
+
+    Registers are interchangeable, so two partial assignments that differ
+    only by renaming registers succeed or fail together. To avoid exploring
+    those copies, a variable may only take a register already in use or the
+    next unused one (max used + 1). The first solution found is unchanged.
     """
 
     var = graph.get_unassigned_variable()         
     if var is None:
         return True                                    # A solution has been found
-    
-    for colour in range(num_regs):                     # checking all possible combinations of registers over the graph
+
+    used = max(graph.assignments.values(), default=-1) + 1
+    limit = min(num_regs, used + 1)                    # registers 0..used are distinct choices; the rest are relabelings
+
+    for colour in range(limit):                        # checking all possible combinations of registers over the graph
 
         if graph.is_safe(var, colour):                 # If valid, an assignment is made
             graph.assign(var, colour)
 
-            if  allocate_registers(graph, num_regs):   #Recursive call -- if it was valid return true 
+            if  _backtrack(graph, num_regs):           #Recursive call -- if it was valid return true 
                 return True
             graph.unassign(var)                        # if not, we unassign and try again 
 
@@ -317,11 +460,11 @@ def print_register_colouring(assignments: dict, num_regs: int) -> None:
       R0: v1, v2
       R1: v3
       ...
+
+    The table is built first and printed with a single call.
     """
     regs = {r: [] for r in range(num_regs)}
     for var, r in assignments.items():
         regs[r].append(var)
 
-    for r in range(num_regs):
-        regs[r].sort()
-        print(f"R{r}: {', '.join(regs[r])}")
+    print("\n".join(f"R{r}: {', '.join(sorted(regs[r]))}" for r in range(num_regs)))
@@ -51,6 +51,10 @@ class Operation:
       dst = src1 op src2
     """
 
+    # One Operation exists per IR line for the whole run; slots drop the
+    # per-instance __dict__
+    __slots__ = ("destination", "operand1", "operator", "operand2", "unary_neg")
+
     def __init__(
         self,
         destination: str,
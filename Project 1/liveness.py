@@ -41,9 +41,15 @@ Misc Notes:
 - Constants are intentionally ignored — - oonly variables have live ranges.
 """
 
-from typing import List, Set, Tuple
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Set, Tuple
 from intermediate import Operation
 
+# Both naming rules from is_var in one pattern, compiled once at import time
+_VAR_RE = re.compile(r"t\d+|[a-su-z]")
+
+@lru_cache(maxsize=None)
 def is_var(tok: str) -> bool:
     """
     Return True if 'tok' matches a VARIABLE name in our IR.
@@ -58,12 +64,11 @@ def is_var(tok: str) -> bool:
       - named vars: single lowercase letter (except plain "t") e.g., a, b, x
 
     If the course spec allows multi-letter names, update this function.
+
+    Results are memoized: a block only has a handful of distinct operand
+    tokens, but each one is checked many times across the pipeline.
     """
-    if tok.startswith("t") and tok[1:].isdigit():
-        return True
-    if len(tok) == 1 and tok.islower() and tok != "t":
-        return True
-    return False
+    return _VAR_RE.fullmatch(tok) is not None
 
 def defs(op: Operation) -> Set[str]:
     """
@@ -109,30 +114,43 @@ def uses(op: Operation) -> Set[str]:
 def compute_liveness(
     ops: List[Operation],
     live_out: Set[str],
-) -> Tuple[List[Set[str]], List[Set[str]]]:
+) -> Tuple[List[FrozenSet[str]], List[FrozenSet[str]]]:
     """
     Returns (live_before, live_after) aligned with ops.
 
     live_before[i] = vars live right before ops[i]
     live_after[i]  = vars live right after  ops[i]
+
+    The sets are frozensets, and an instruction that doesn't change the
+    live set passes the same object along, so callers must treat them as
+    read-only.
+
+    How it works:
+      Each live set is built from the one below it with
+          live_before = uses | (live_after - defs)
+      but a new frozenset is only made when the instruction actually kills
+      or adds a variable. live_after[i] is always the same object as
+      live_before[i + 1], so nothing is copied.
     """
     n = len(ops)
-    live_before: List[Set[str]] = [set() for i in range(n)]
-    live_after:  List[Set[str]] = [set() for i in range(n)]
+    live_before: List[FrozenSet[str]] = [None] * n
+    live_after: List[FrozenSet[str]] = [None] * n
 
-    current_live = set(live_out)   # what's live after the end of the block
+    current = frozenset(live_out)   # what's live after the end of the block
 
-    # walk bottom -> top
+    # walk bottom -> top, with defs()/uses() inlined
     for i in range(n - 1, -1, -1):
-        live_after[i] = set(current_live)
-
-        d = defs(ops[i])
-        u = uses(ops[i])
+        op = ops[i]
+        live_after[i] = current
 
-        live_before[i] = u | (live_after[i] - d)
+        dst, src1, src2 = op.destination, op.operand1, op.operand2
+        if dst in current and dst != src1 and dst != src2:
+            current = current - {dst}
+        if src1 is not None and src1 not in current and is_var(src1):
+            current = current | {src1}
+        if src2 is not None and src2 not in current and is_var(src2):
+            current = current | {src2}
 
-        # move up
-        current_live = live_before[i]
+        live_before[i] = current
 
     return live_before, live_after
-
@@ -47,26 +47,35 @@ Usage Example:
 
 """
 import sys
+from typing import List
 from errors import ParseError
 from parser import readIntermediateCode
 from interference import build_interference_graph, allocate_registers, print_register_colouring
 from codegen import generate_target
 
-def main() -> int:
-    
-    if len(sys.argv) != 3:
+def main(argv: List[str] = None) -> int:
+    """
+    Run the whole pipeline and return the exit code.
+
+    argv holds the arguments after the program name, i.e. [num_regs, filename];
+    it defaults to sys.argv[1:] so tests can call main() directly.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if len(argv) != 2:
         print("Usage: python main.py <num_regs> <input_filename>", file=sys.stderr)
         return 2
     
     try:                                                    # Requirement: Argument one must be an integer > 0
-        num_regs = int(sys.argv[1])
+        num_regs = int(argv[0])
         if num_regs <= 0:
             raise ValueError
     except ValueError:
         print("Error: <num_regs> must be a positive integer", file=sys.stderr)
         return 2
 
-    filename = sys.argv[2]
+    filename = argv[1]
 
     try:
         with open(filename, "r") as f:
@@ -95,10 +104,10 @@ def main() -> int:
         with open(out_file, "w") as f:
             f.write(str(target))
             
-        print("Variable -> Register assignment:")
-
-        for var in sorted(graph.assignments):  
-            print(f"{var}: R{graph.assignments[var]}") 
+        lines = ["Variable -> Register assignment:"]
+        for var, reg in sorted(graph.assignments.items()):
+            lines.append(f"{var}: R{reg}")
+        print("\n".join(lines))
         return 0
     else:
         print(f"FAILED: graph is not {num_regs}-colourable (not enough registers).")
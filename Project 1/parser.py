@@ -39,14 +39,33 @@ NA
 
 """
 
-from typing import TextIO, List
+from typing import TextIO, List, Sequence, Tuple
 
-import string
 import re
+import string
+import sys
+from functools import lru_cache
 from errors import ParseError
 from intermediate import Operation, IntermediateCode
 
 
+# Patterns are compiled once at import time instead of on every call.
+_TOKEN_RE = re.compile(r"-?\d+|[A-Za-z][A-Za-z0-9_]*|[=+\-*/]")
+
+# Binary operators, and the tokens that are always exactly one character long.
+_BIN_OPS = frozenset("+-*/")
+_SINGLE_CHAR_TOKENS = _BIN_OPS | {"="}
+
+# Characters allowed on an instruction line. Translating a line through
+# _DROP_VALID_CHARS deletes every valid character and all whitespace,
+# leaving only offenders.
+_VALID_CHARS = frozenset(string.ascii_letters + string.digits + "+-/*=_")
+_DROP_VALID_CHARS = str.maketrans("", "", "".join(_VALID_CHARS) + string.whitespace)
+
+# Token classes returned by _classify
+_TOK_INVALID, _TOK_VAR, _TOK_INT, _TOK_OP = range(4)
+
+
 def readIntermediateCode(f: TextIO) -> IntermediateCode:
     """
     Parse an entire intermediate-code input file.
@@ -56,7 +75,7 @@ def readIntermediateCode(f: TextIO) -> IntermediateCode:
       - One final non-empty line of the form: 'live: ...'
 
     Responsibilities:
-    - Read all non-empty lines
+    - Read non-empty lines one at a time
     - Parse each instruction line using read3AddrInstruction
     - Parse the final live-out line using parse_live_lineA
 
@@ -76,20 +95,36 @@ def readIntermediateCode(f: TextIO) -> IntermediateCode:
     """
 
 
+    # Stream the file one line at a time: instruction lines are parsed as
+    # they are read, and the 'live:' line ends the block. Blank lines carry
+    # no instructions and are skipped; enumerate keeps each line's real
+    # file line number for error messages
     operations = []
-    prev = None
-
-    for line in f:
-        if prev is not None:
-            op = read3AddrInstruction(prev)
-            if op is not None:
-              operations.append(op)
-        prev = line
-
-    if prev is None:
-        raise ParseError("Empty file")
-
-    live_out = parse_live_line(prev, operations)
+    live_out = None
+    line_num = 0
+    last_num = 0  # last non-blank line, for the missing 'live:' error
+
+    try:
+        for line_num, line in enumerate(f, 1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            last_num = line_num
+
+            if live_out is not None:
+                raise ParseError("'live:' must be the final line")
+
+            if stripped.startswith("live:"):
+                live_out = parse_live_line(stripped, operations)
+            else:
+                operations.append(read3AddrInstruction(stripped))
+    except ParseError as e:
+        raise ParseError(f"line {line_num}: {e}") from None
+
+    if live_out is None:
+        if not operations:
+            raise ParseError("Empty file")
+        raise ParseError(f"line {last_num}: Final line must start with 'live:'")
 
     return IntermediateCode(operations, live_out)  
 
@@ -118,6 +153,12 @@ def tokenize_line(line: str) -> List[str]:
     if not line:
         return[] 
 
+    # Validate every character of the line in one pass, before splitting, so
+    # stray characters are reported instead of silently dropped by findall
+    invalid = line.translate(_DROP_VALID_CHARS)
+    if invalid:
+        raise ParseError(f"Invalid character '{invalid[0]}' in line: {line}")
+
     """Removes delimiters/spaces and if they are next to eachother
     only splits over whitespace/semi-colon/commas
     hence breaks when there is a delimeter between them like "a=a+1" or "t1=t2*3"
@@ -129,23 +170,24 @@ def tokenize_line(line: str) -> List[str]:
     # delimiters = r"[,\s;\n]+"
     # tokens = re.split(delimiters, line.strip()) 
 
-    """ New (extract tokens directly, including operators as tokens)"""
-    token_pattern = r"-?\d+|[A-Za-z][A-Za-z0-9_]*|[=+\-*/]"
-    tokens = re.findall(token_pattern, line)
-
-    # Validate tokens
-    valid_chars = set(string.ascii_letters + string.digits + "+-/*=_")
-    valid_tokens = []
-    for t in tokens:
-      for ch in t:
-        if ch not in valid_chars:
-          raise ParseError(f"Invalid character '{ch}' in token: {t}")
-        
-    # output valid tokens to a list
-         
-      valid_tokens.append(t)
-   
-    return valid_tokens
+    # Fast path: a whitespace-separated line whose pieces are already whole
+    # tokens (e.g. "a = b + 1") can skip the regex engine entirely.
+    parts = line.split()
+    if all(_classify(p) != _TOK_INVALID for p in parts):
+        tokens = parts
+    else:
+        # Extract tokens directly, including operators as tokens
+        tokens = _TOKEN_RE.findall(line)
+
+        # findall skips anything the pattern cannot match (e.g. the '_' in
+        # '_a'), so if the tokens don't account for every non-space
+        # character, part of the line was not a token
+        if sum(map(len, tokens)) != len("".join(parts)):
+            raise ParseError(f"Unrecognized token in line: {line}")
+
+    # Intern variable names so every occurrence of a name shares one string
+    # object; later set/dict lookups on it can then short-circuit on identity
+    return [sys.intern(t) if _classify(t) == _TOK_VAR else t for t in tokens]
 
         
 """ 
@@ -155,18 +197,51 @@ Below defines the main read3AddrInstruction function and all its complimentary h
 (3) validate_length_3
 (4) validate_length_4
 (5) validate_length_5 
-(6) dest_equals_source_check
 
  """
 
 
+def _is_var(s: str) -> bool:
+    """
+    Identifier check (a letter, then letters, digits or "_") without the regex engine.
+    """
+    return s.isascii() and s.isidentifier() and s[0] != "_"
+
+
+def _is_int(s: str) -> bool:
+    """
+    Integer literal check (optional leading "-", then digits) without the regex engine.
+    """
+    digits = s[1:] if s.startswith("-") else s
+    return digits.isdecimal()
+
+
+@lru_cache(maxsize=4096)
+def _classify(tok: str) -> int:
+    """
+    Classify a token as a variable, integer literal or operator.
+
+    The same names (a, b, t1, ...) repeat throughout a block, so results are
+    memoized and repeated tokens cost a single cache lookup.
+    """
+    if _is_var(tok):
+        return _TOK_VAR
+    if _is_int(tok):
+        return _TOK_INT
+    if tok in _SINGLE_CHAR_TOKENS:
+        return _TOK_OP
+    return _TOK_INVALID
+
+
 def is_valid_variable(var: str) -> bool:
     """
     Project variable rule:
       - one lowercase letter excluding 't'  (a..z but not t)
       - OR 't' followed by one or more digits (t1, t2, ...)
     """
-    return bool(re.fullmatch(r"(?:[a-su-z]|t\d+)", var))
+    if len(var) == 1:
+        return "a" <= var <= "z" and var != "t"
+    return var.startswith("t") and var[1:].isdecimal()
 
 
 
@@ -174,18 +249,11 @@ def is_valid_operand(s: str) -> bool:
     """
     Checkk if string is a valid operand (variable or integer literal)..
     """
-    is_var = re.fullmatch(r"[A-Za-z][A-Za-z0-9_]*", s)
-    is_int = re.fullmatch(r"-?\d+", s)
-    
-    if is_var:
-        return True
-    if is_int:
-        return True
-    return False
+    return _classify(s) in (_TOK_VAR, _TOK_INT)
 
 
 
-def validate_length_3(tokens):
+def validate_length_3(tokens: Sequence[str]) -> Tuple:
     """
     Validate and handle dst = src format.
     """
@@ -193,10 +261,12 @@ def validate_length_3(tokens):
 
     if not is_valid_operand(src):
         raise ParseError("Invalid source within [dst = src] format.")
-    
+
+    return (tokens[0], src, None, None, False)
 
 
-def validate_length_4(tokens):
+
+def validate_length_4(tokens: Sequence[str]) -> Tuple:
     """
     Validate and handle dst = -src format.
     """
@@ -208,10 +278,12 @@ def validate_length_4(tokens):
 
     if not is_valid_operand(src):
         raise ParseError("Invalid source within [dst = -src] format.")
-    
+
+    return (tokens[0], src, None, None, True)
+
 
 
-def validate_length_5(tokens):
+def validate_length_5(tokens: Sequence[str]) -> Tuple:
     """
     Validate and handle dst = src1 op src2 format.
     """
@@ -220,7 +292,7 @@ def validate_length_5(tokens):
     src2 = tokens[4]
 
     # Validate operator
-    if op not in {"+", "-", "*", "/"}:
+    if op not in _BIN_OPS:
         raise ParseError("Invalid operator in [dst = src1 op src2] format.")
 
     # Validate src11
@@ -230,7 +302,19 @@ def validate_length_5(tokens):
     # Validate src2
     if not is_valid_operand(src2):
         raise ParseError("Invalid second operand in [dst = src1 op src2] format.")
-    
+
+    return (tokens[0], src1, op, src2, False)
+
+
+
+# Instruction length -> handler that validates the operands and returns the
+# Operation fields (destination, operand1, operator, operand2, unary_neg)
+_DISPATCH = {
+    3: validate_length_3,   # dst = src
+    4: validate_length_4,   # dst = -src
+    5: validate_length_5,   # dst = src1 op src2
+}
+
 
 
 def read3AddrInstruction(line: str) -> Operation:
@@ -248,57 +332,47 @@ def read3AddrInstruction(line: str) -> Operation:
     - op must be one of +, -, *, /
 
     Returns:
-      An Operation (three-address instruction) object.
+      A new Operation (three-address instruction) object.
 
     Raises:
       ParseError if the instruction format is invalid.
     """
-    # tokenzied line with valid op check already done
-    tokens = tokenize_line(line)
-  
-    # skip blank lines
-    if not tokens:
-        return None
+    # Every instruction is an assignment; reject lines without '=' before
+    # paying for tokenization
+    if "=" not in line:
+        if not line.strip():
+            return None
+        raise ParseError("Missing '=' in instruction.")
+
+    # tokenzied line with valid op check already done; each line gets its
+    # own Operation built from the cached, already-validated fields
+    return Operation(*_parse_tokens(tuple(tokenize_line(line))))
 
-    length = len(tokens)
 
-    if length not in (3, 4, 5):
+
+@lru_cache(maxsize=4096)
+def _parse_tokens(tokens: Tuple[str, ...]) -> Tuple:
+    """
+    Validate a tokenized instruction and return its Operation fields
+    (destination, operand1, operator, operand2, unary_neg).
+
+    Blocks often repeat the same instruction (e.g. 't1 = 0'), so results
+    are memoized on the token tuple and a repeat skips validation entirely.
+    Only the immutable fields are cached; callers build a fresh Operation
+    from them so parses never share a mutable object.
+    """
+    handler = _DISPATCH.get(len(tokens))
+    if handler is None:
         raise ParseError("Invalid instruction size. Expected three-address instruction.")
 
+    if tokens[1] != "=":
+        raise ParseError("Expected '=' after the destination.")
+
     # Validate destination variable
-    dest = tokens[0]
-    if not is_valid_variable(dest):
+    if not is_valid_variable(tokens[0]):
         raise ParseError("Invalid destination type.")
 
-    dest_equals_source_check(length, tokens)
-
-    # Return the appropriate Operation based on instruction type
-    if length == 3:
-        # dst = src
-        return Operation(dest, tokens[2])
-    elif length == 4:
-        # dst = -src (unary minus)
-        return Operation(dest, tokens[3], unary_neg=True)
-    elif length == 5:
-        # dst = src1 op src2
-        return Operation(dest, tokens[2], tokens[3], tokens[4])
-    
-
-
-def dest_equals_source_check(length: int, tokens: List[str]) -> None:
-    """
-    This helper function (given the len(token) and tokens = tokenize_line(line)) checks
-    which condition needs to be looked at of the three potential options.
-    """
-    # dst = src
-    if length == 3:
-        validate_length_3(tokens)
-    # checks if dst = -src
-    elif length == 4:
-        validate_length_4(tokens)
-    # dst = src1 op src2
-    elif length == 5:
-        validate_length_5(tokens)
+    return handler(tokens)
 
 
 
@@ -338,27 +412,23 @@ def parse_live_line(line: str, operations: List[Operation]) -> List[str]:
     if not rest_of_line:
         return []
 
-    # splits the rest of the string on comma's to get each variable
-    live_vars = rest_of_line.split(',')
-    
-    
-     # Clean up whitespace and validate each variable
-    for i in range(len(live_vars)):
-        live_vars[i] = live_vars[i].strip()
-        # Check if valid variable name 
-        if not is_valid_variable(live_vars[i]):
-            raise ParseError(f"Invalid variable name: '{live_vars[i]}'")
-    
-    # Check that each live variable appeared in the code
+    # splits the rest of the string on comma's to get each variable,
+    # cleaning up whitespace as we go
+    live_vars = [v.strip() for v in rest_of_line.split(',')]
+
+    # Collect every name referenced in the code once, then check membership
+    referenced = set()
+    for op in operations:
+        referenced.add(op.destination)
+        referenced.add(op.operand1)
+        referenced.add(op.operand2)
+
+    # Check each live variable is a valid name that appeared in the code,
+    # in a single pass over the list
     for var in live_vars:
-        found = False
-        
-        for op in operations:
-            if var == op.destination or var == op.operand1 or var == op.operand2:
-                found = True
-                break
-        
-        if not found:
+        if not is_valid_variable(var):
+            raise ParseError(f"Invalid variable name: '{var}'")
+        if var not in referenced:
             raise ParseError(f"Variable '{var}' not found in code")
     
     return live_vars
@@ -33,7 +33,7 @@ Misc Notes:
 NA
 """
 
-from typing import List
+from typing import Iterable, List
 
 
 class AsmInstruction:
@@ -57,6 +57,9 @@ class AsmInstruction:
         MOV R1,a
         MUL R2,R3
     """
+    # One instance per emitted instruction; slots drop the per-instance __dict__
+    __slots__ = ("opcode", "src", "dst")
+
     def __init__(self, opcode: str, src: str = None, dst: str = None, UnaryNeg: bool = False):
         self.opcode = opcode
         self.src = src if not UnaryNeg else -src #might be an incorrect implementation. Double check.
@@ -86,12 +89,15 @@ class TargetCode:
     def add(self, instr: AsmInstruction) -> None:
         self.instructions.append(instr)             # Append an assembly instruction to the target code sequence.
 
+    def extend(self, instrs: Iterable[AsmInstruction]) -> None:
+        self.instructions.extend(instrs)            # Append several assembly instructions in order.
+
     def __str__(self) -> str:
         """
         Return the complete target code as a newline-separated string
         suitable for writing to an output .s file.
         """
-        return "\n".join(str(i) for i in self.instructions)
+        return "\n".join(map(str, self.instructions))
 
 
         
@@ -45,4 +45,16 @@ live: a, b, c
 
     success = allocate_registers(graph, 2)
 
-    assert not success
\ No newline at end of file
+    assert not success
+
+def test_main_writes_assembly(tmp_path, capsys):
+    from main import main
+
+    source = tmp_path / "prog.txt"
+    source.write_text("a = a + 1\nt1 = a * 2\nb = t1 / 3\nlive: a, b\n")
+
+    assert main(["2", str(source)]) == 0
+    assert "SUCCESS" in capsys.readouterr().out
+    assert "DIV" in (tmp_path / "prog.txt.s").read_text()
+
+    assert main(["0", str(source)]) == 2
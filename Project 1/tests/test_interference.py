@@ -1,6 +1,7 @@
 import io
 from parser import readIntermediateCode
-from interference import build_interference_graph, allocate_registers
+from interference import InterferenceGraph, build_interference_graph, allocate_registers
+from intermediate import IntermediateCode, Operation
 
 
 def test_no_interference():
@@ -61,4 +62,28 @@ live: c
 
     success = allocate_registers(graph, 1)
 
-    assert success is False
\ No newline at end of file
+    assert success is False
+
+def test_add_clique():
+    graph = InterferenceGraph(["a", "b", "c", "d"])
+    graph.add_clique({"a", "b", "c"})
+
+    assert graph.get_neighbors("a") == {"b", "c"}
+    assert graph.get_neighbors("c") == {"a", "b"}
+    assert graph.get_neighbors("d") == set()
+
+
+def test_graph_after_oplist_mutated_in_place():
+    code = IntermediateCode(live_out=["a"])
+    code.oplist.append(Operation("a", "b", "+", "1"))
+    code.compute_liveness_info()
+
+    graph = build_interference_graph(code)
+    assert set(graph.nodes) == {"a", "b"}
+
+    code.oplist[:] = [Operation("c", "d", "*", "e"), Operation("a", "c")]
+    code.compute_liveness_info()
+
+    graph = build_interference_graph(code)
+    assert set(graph.nodes) == {"a", "c", "d", "e"}
+    assert "e" in graph.get_neighbors("d")
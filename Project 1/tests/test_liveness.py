@@ -1,5 +1,6 @@
 import io
 from parser import readIntermediateCode
+from liveness import defs, uses
 
 
 def test_liveness():
@@ -19,4 +20,36 @@ live: a, b
     assert "a" in code.live_before[1]
 
     # Instruction 0: a = a + 1
-    assert "a" in code.live_before[0]
\ No newline at end of file
+    assert "a" in code.live_before[0]
+
+def test_equal_live_sets_are_shared():
+    program = """a = 1
+b = a + 1
+live: b
+"""
+    code = readIntermediateCode(io.StringIO(program))
+    code.compute_liveness_info()
+
+    # live_after[i] is always the same set as live_before[i + 1]
+    assert code.live_after[0] is code.live_before[1]
+    assert code.live_before[1] == frozenset({"a"})
+
+
+def test_defs_uses_match_computed_liveness():
+    # compute_liveness inlines defs()/uses(); both must agree
+    program = """a = a + 1
+t1 = -a
+b = t1 / 3
+c = 4
+t1 = b - c
+a = t1
+live: a, b
+"""
+    code = readIntermediateCode(io.StringIO(program))
+    code.compute_liveness_info()
+
+    assert uses(code.oplist[0]) == {"a"}
+    assert uses(code.oplist[3]) == set()
+    assert defs(code.oplist[4]) == {"t1"}
+    for i, op in enumerate(code.oplist):
+        assert code.live_before[i] == uses(op) | (code.live_after[i] - defs(op))
@@ -1,7 +1,8 @@
 import io
 import pytest
-from parser import readIntermediateCode
+from parser import readIntermediateCode, is_valid_variable, is_valid_operand
 from errors import ParseError
+from intermediate import Operation
 
 
 def test_empty_file():
@@ -42,4 +43,91 @@ live: x
     f = io.StringIO(program)
 
     with pytest.raises(ParseError):
-        readIntermediateCode(f)
\ No newline at end of file
+        readIntermediateCode(f)
+
+def test_variable_and_operand_rules():
+    assert is_valid_variable("a")
+    assert is_valid_variable("t12")
+    assert not is_valid_variable("t")
+    assert not is_valid_variable("aa")
+
+    assert is_valid_operand("x1")
+    assert is_valid_operand("-10")
+    assert not is_valid_operand("-")
+    assert not is_valid_operand("_a")
+
+
+def test_blank_lines_are_skipped():
+    program = """a = 5
+
+b = a + 1
+live: b
+
+"""
+    code = readIntermediateCode(io.StringIO(program))
+
+    assert len(code.oplist) == 2
+    assert code.live_out == ["b"]
+
+
+def test_invalid_character():
+    program = """a = 1 @ 2
+live: a
+"""
+    with pytest.raises(ParseError, match="Invalid character '@'"):
+        readIntermediateCode(io.StringIO(program))
+
+
+def test_live_variable_may_be_an_operand():
+    # 'a' is only ever read, never assigned, but still appears in the code
+    code = readIntermediateCode(io.StringIO("""t1 = a * 4
+b = -t1
+live: a, b
+"""))
+
+    assert code.live_out == ["a", "b"]
+
+
+def test_missing_equals():
+    for bad in ("a + b\nlive: a\n", "a b = c\nlive: a\n"):
+        with pytest.raises(ParseError):
+            readIntermediateCode(io.StringIO(bad))
+
+
+def test_error_reports_file_line_number():
+    program = """a = 5
+
+b = a $ 1
+live: b
+"""
+    with pytest.raises(ParseError, match="^line 3: "):
+        readIntermediateCode(io.StringIO(program))
+
+    # trailing blank lines don't move the missing 'live:' error past the last instruction
+    with pytest.raises(ParseError, match="^line 2: "):
+        readIntermediateCode(io.StringIO("a = 1\nb = a\n\n\n\n"))
+
+
+def test_unrecognized_token():
+    with pytest.raises(ParseError):
+        readIntermediateCode(io.StringIO("x=_a\nlive: x\n"))
+
+
+def test_live_line_must_be_last():
+    program = """a = 5
+live: a
+b = a
+"""
+    with pytest.raises(ParseError, match="final line"):
+        readIntermediateCode(io.StringIO(program))
+
+
+def test_repeated_lines_get_distinct_operations():
+    code = readIntermediateCode(io.StringIO("a = b + 1\na = b + 1\nlive: a\n"))
+    first, second = code.oplist
+    assert first is not second
+
+    first.operand2 = "2"
+    again = readIntermediateCode(io.StringIO("a = b + 1\nlive: a\n"))
+    assert second.operand2 == "1"
+    assert again.oplist[0].operand2 == "1"
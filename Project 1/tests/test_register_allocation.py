@@ -1,6 +1,6 @@
 import io
 from parser import readIntermediateCode
-from interference import build_interference_graph, allocate_registers
+from interference import InterferenceGraph, build_interference_graph, allocate_registers, simplify_colour
 
 
 def test_allocation_success():
@@ -28,4 +28,50 @@ live: a, b, c
     graph = build_interference_graph(code)
 
     success = allocate_registers(graph, 2)
-    assert not success
\ No newline at end of file
+    assert not success
+
+def test_simplify_colour_stalls_then_backtracking_succeeds():
+    # A 4-cycle: every node has 2 neighbours, so simplification with 2
+    # registers stalls even though the graph is 2-colourable.
+    graph = InterferenceGraph(["a", "b", "c", "d"])
+    for u, v in [("a", "b"), ("b", "c"), ("c", "d"), ("d", "a")]:
+        graph.add_edge(u, v)
+
+    assert not simplify_colour(graph, 2)
+    assert graph.assignments == {}
+
+    assert allocate_registers(graph, 2)
+    for var, neighbors in graph.nodes.items():
+        assert all(graph.assignments[var] != graph.assignments[n] for n in neighbors)
+
+
+def test_color_mask_tracks_assign_and_unassign():
+    graph = InterferenceGraph(["a", "b", "c"])
+    graph.add_edge("a", "b")
+    graph.add_edge("a", "c")
+
+    graph.assign("b", 1)
+    graph.assign("c", 1)
+    assert not graph.is_safe("a", 1)
+
+    # c still holds color 1, so a must remain blocked from it
+    graph.unassign("b")
+    assert not graph.is_safe("a", 1)
+
+    graph.unassign("c")
+    assert graph.is_safe("a", 1)
+    assert graph.color_mask["a"] == 0
+
+
+def test_get_unassigned_variable_follows_node_order():
+    graph = InterferenceGraph(["a", "b", "c"])
+    graph.assign("a", 0)
+    graph.assign("b", 0)
+    assert graph.get_unassigned_variable() == "c"
+
+    graph.unassign("a")
+    assert graph.get_unassigned_variable() == "a"
+
+    graph.assign("a", 0)
+    graph.assign("c", 0)
+    assert graph.get_unassigned_variable() is None